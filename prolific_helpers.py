@@ -2,14 +2,204 @@
 Helper functions for Prolific API interactions and study management.
 """
 
+import asyncio
+import csv
 import json
+import sys
+import time
 import uuid
 import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.exceptions import MaxRetryError, ResponseError
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from zoneinfo import ZoneInfo
-from io import StringIO
+from io import BufferedReader, BytesIO, StringIO
+import numpy as np
 import pandas as pd
 
+__all__ = [
+    "get_researcher_id",
+    "create_survey",
+    "create_study",
+    "publish_study",
+    "show_study_results",
+    "clear_cache",
+    "get_researcher_id_async",
+    "create_survey_async",
+    "create_study_async",
+    "create_studies_batch",
+    "BatchCreateError",
+    "publish_study_async",
+    "show_study_results_async",
+    "gather_study_results",
+    "find_question_column",
+    "aggregate_responses",
+    "plot_survey_responses",
+    "ages_to_generations",
+    "age_to_generation",
+    "plot_responses_by_generation",
+    "plot_responses_by_gender",
+]
+
+# Encode request bodies with orjson when it is installed; it is several times
+# faster than the stdlib encoder and returns bytes ready to send.
+try:
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+# Parse exports with pyarrow when it is installed: it is several times faster
+# on wide exports and yields Arrow-backed string columns.
+try:
+    import pyarrow  # noqa: F401
+    _READ_CSV_OPTIONS = {"engine": "pyarrow", "dtype_backend": "pyarrow"}
+except ImportError:
+    _READ_CSV_OPTIONS = {}
+
+
+class _RateLimitRetry(Retry):
+    """
+    Retry policy that only repeats a POST when it was rate limited.
+
+    POST is left out of allowed_methods, so urllib3 never replays one after a
+    read error or dropped connection, or on a 5xx: the request may have been
+    processed, and repeating it could create a duplicate survey or study.
+    is_retry lets a POST through only on 429, which means the request was
+    rejected unprocessed.
+
+    A Retry-After longer than MAX_RETRY_AFTER seconds is not waited out; the
+    429 is returned to the caller instead of blocking for that long.
+    """
+
+    MAX_RETRY_AFTER = 120  # seconds
+
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if method == "POST":
+            return status_code == 429
+        return super().is_retry(method, status_code, has_retry_after)
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        if response is not None and self.respect_retry_after_header:
+            retry_after = self.get_retry_after(response)
+            if retry_after is not None and retry_after > self.MAX_RETRY_AFTER:
+                # Treated as exhausted retries: with raise_on_status=False the
+                # response itself is handed back to raise_for_status()
+                raise MaxRetryError(
+                    _pool, url, ResponseError(f"Retry-After of {retry_after:.0f}s exceeds the limit")
+                )
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+
+# Shared session so repeated calls reuse pooled keep-alive connections
+# instead of paying a new TCP + TLS handshake each time. Rate-limited (429)
+# and transient gateway errors are retried with exponential backoff, waiting
+# as long as the API's Retry-After header asks (up to a limit), so callers do
+# not need their own sleep-and-retry loops.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        # raise_on_status=False hands the final response back so that
+        # raise_for_status() still surfaces an HTTPError once retries run out
+        max_retries=_RateLimitRetry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=(429, 502, 503, 504),
+            allowed_methods=frozenset({"GET"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        ),
+    ),
+)
+
+# Researcher IDs never change, so they are cached per Authorization header.
+_RESEARCHER_IDS = {}
+
+# Study details are cached briefly so tight polling loops skip the GET.
+# Maps study_id -> (expires_at, study_info) on the time.monotonic() clock.
+_STUDY_INFO_CACHE = {}
+_STUDY_INFO_TTL = 10  # seconds
+
+# How times are shown in study summaries, e.g. "29 Sep 2025, 06:08 AM PDT"
+_DISPLAY_TIME_FORMAT = '%d %b %Y, %I:%M %p %Z'
+
+
+def clear_cache():
+    """Forget all cached researcher IDs, study details and question columns."""
+    _RESEARCHER_IDS.clear()
+    _STUDY_INFO_CACHE.clear()
+    _COL_CACHE.clear()
+
+
+def _auth_token(headers: dict):
+    """Return the Authorization header, whatever its casing, or None if absent."""
+    return CaseInsensitiveDict(headers).get("Authorization")
+
+
+def _response_ttl(response_headers, default: float) -> float:
+    """
+    Work out how long a response may be reused.
+
+    Honors Cache-Control (no-store, no-cache, max-age) and Expires when the
+    API sends them, otherwise falls back to the given default.
+
+    Args:
+        response_headers: Case-insensitive mapping of response headers
+        default: TTL in seconds to use when the response has no caching headers
+
+    Returns:
+        float: Number of seconds the response stays fresh
+    """
+    cache_control = response_headers.get("Cache-Control", "").lower()
+    directives = [directive.strip() for directive in cache_control.split(",")]
+
+    if "no-store" in directives or "no-cache" in directives:
+        return 0
+
+    for directive in directives:
+        name, _, value = directive.partition("=")
+        if name == "max-age":
+            try:
+                return int(value.strip('"'))
+            except ValueError:
+                return 0
+
+    expires = response_headers.get("Expires")
+    if expires:
+        try:
+            return (parsedate_to_datetime(expires) - datetime.now(timezone.utc)).total_seconds()
+        except (TypeError, ValueError):
+            # Invalid dates mean "already expired"
+            return 0
+
+    return default
+
+
+def _cached_study_info(study_id: str):
+    """Return cached study details if still fresh, otherwise None."""
+    entry = _STUDY_INFO_CACHE.get(study_id)
+    if entry is not None and time.monotonic() < entry[0]:
+        return entry[1]
+    return None
+
+
+def _store_study_info(study_id: str, study_info: dict, response_headers) -> None:
+    """Cache study details for as long as the response allows."""
+    ttl = _response_ttl(response_headers, _STUDY_INFO_TTL)
+    if ttl > 0:
+        _STUDY_INFO_CACHE[study_id] = (time.monotonic() + ttl, study_info)
+    else:
+        _STUDY_INFO_CACHE.pop(study_id, None)
+
 
 def get_researcher_id(headers: dict) -> str:
     """
@@ -21,9 +211,16 @@ def get_researcher_id(headers: dict) -> str:
     Returns:
         str: The researcher ID
     """
-    res = requests.get("https://api.prolific.com/api/v1/users/me/", headers=headers)
+    token = _auth_token(headers)
+    if token is not None and token in _RESEARCHER_IDS:
+        return _RESEARCHER_IDS[token]
+
+    res = _SESSION.get("https://api.prolific.com/api/v1/users/me/", headers=headers)
     res.raise_for_status()
-    return res.json()["id"]
+    researcher_id = res.json()["id"]
+    if token is not None:
+        _RESEARCHER_IDS[token] = researcher_id
+    return researcher_id
 
 
 def create_survey(headers: dict, researcher_id: str, survey_config: dict) -> str:
@@ -41,10 +238,25 @@ def create_survey(headers: dict, researcher_id: str, survey_config: dict) -> str
     Returns:
         str: The survey ID
     """
-    # Generate UUIDs
-    section_id = str(uuid.uuid4())
-    question_id = str(uuid.uuid4())
-    answer_ids = [str(uuid.uuid4()) for _ in survey_config["answers"]]
+    survey_data = _build_survey_payload(researcher_id, survey_config)
+
+    response = _SESSION.post(
+        "https://api.prolific.com/api/v1/surveys/",
+        headers={**headers, "Content-Type": "application/json"},
+        data=_dumps(survey_data)
+    )
+    response.raise_for_status()
+
+    return response.json()["_id"]
+
+
+def _build_survey_payload(researcher_id: str, survey_config: dict) -> dict:
+    """Build the request body for creating a survey."""
+    # Generate all UUIDs in one pass. Survey ids are sent in the dashed
+    # form the Prolific surveys API documents, so keep str() over .hex
+    section_id, question_id, *answer_ids = [
+        str(uuid.uuid4()) for _ in range(len(survey_config["answers"]) + 2)
+    ]
 
     # Build answers list
     answers = [
@@ -74,14 +286,7 @@ def create_survey(headers: dict, researcher_id: str, survey_config: dict) -> str
         "questions": [question],
     }
 
-    response = requests.post(
-        "https://api.prolific.com/api/v1/surveys/",
-        headers=headers,
-        data=json.dumps(survey_data)
-    )
-    response.raise_for_status()
-
-    return response.json()["_id"]
+    return survey_data
 
 
 def create_study(
@@ -111,13 +316,30 @@ def create_study(
     Returns:
         str: The study ID
     """
-    # Generate completion code with timestamp
-    completion_code = f"AI_DAILYLIFE_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    study_data = _build_study_payload(survey_id, study_config, project_id)
+
+    # Create draft study
+    study_response = _SESSION.post(
+        "https://api.prolific.com/api/v1/studies/",
+        headers={**headers, "Content-Type": "application/json"},
+        data=_dumps(study_data)
+    )
+    study_response.raise_for_status()
+
+    return study_response.json().get("id")
+
+
+def _build_study_payload(survey_id: str, study_config: dict, project_id: str) -> dict:
+    """Build the request body for creating a draft study."""
+    # Generate completion code with timestamp, shared with the internal name
+    # so the two cannot straddle a second boundary
+    stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    completion_code = f"AI_DAILYLIFE_{stamp}"
 
     # Build the study payload
     study_data = {
         "name": study_config["name"],
-        "internal_name": f"{study_config.get('internal_name_prefix', study_config['name'])} {datetime.now().strftime('%Y%m%d_%H%M%S')}",
+        "internal_name": f"{study_config.get('internal_name_prefix', study_config['name'])} {stamp}",
         "description": study_config["description"],
         "external_study_url": f"https://prolific.com/surveys/{survey_id}",
         "completion_codes": [
@@ -137,15 +359,7 @@ def create_study(
         "project": project_id
     }
 
-    # Create draft study
-    study_response = requests.post(
-        "https://api.prolific.com/api/v1/studies/",
-        headers=headers,
-        data=json.dumps(study_data)
-    )
-    study_response.raise_for_status()
-
-    return study_response.json().get("id")
+    return study_data
 
 
 def publish_study(headers: dict, study_id: str) -> int:
@@ -159,17 +373,22 @@ def publish_study(headers: dict, study_id: str) -> int:
     Returns:
         int: HTTP status code
     """
-    publish_response = requests.post(
+    publish_response = _SESSION.post(
         f"https://api.prolific.com/api/v1/studies/{study_id}/transition/",
-        headers=headers,
-        data=json.dumps({"action": "PUBLISH"})
+        headers={**headers, "Content-Type": "application/json"},
+        data=_dumps({"action": "PUBLISH"})
     )
     publish_response.raise_for_status()
 
     return publish_response.status_code
 
 
-def show_study_results(study_id: str, headers: dict, timezone_str: str = "America/Los_Angeles") -> pd.DataFrame:
+def show_study_results(
+    study_id: str,
+    headers: dict,
+    timezone_str: str = "America/Los_Angeles",
+    usecols: list = None
+) -> pd.DataFrame:
     """
     Fetch and display Prolific study info, latest response, and completion duration.
 
@@ -177,17 +396,74 @@ def show_study_results(study_id: str, headers: dict, timezone_str: str = "Americ
         study_id: The study ID
         headers: Dictionary containing API authorization headers
         timezone_str: Timezone string for displaying times (default: "America/Los_Angeles")
+        usecols: Optional question column name, or list of names, to keep.
+            When given, the export is narrowed to these plus Submission id,
+            Completed at, Age, Sex and any "Custom ..." columns; by default
+            every column is kept
 
     Returns:
         pd.DataFrame: DataFrame containing study responses
     """
-    display_tz = ZoneInfo(timezone_str)
-
-    # --- Get study details ---
     study_url = f"https://api.prolific.com/api/v1/studies/{study_id}/"
-    study_response = requests.get(study_url, headers=headers)
-    study_response.raise_for_status()
-    study_info = study_response.json()
+    responses_url = f"https://api.prolific.com/api/v1/studies/{study_id}/export/"
+
+    # Study details are reused for a few seconds when polling
+    study_info = _cached_study_info(study_id)
+
+    # --- Get study details and response exports concurrently ---
+    study_future = None
+    if study_info is None:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            study_future = executor.submit(_SESSION.get, study_url, headers=headers)
+            export_future = executor.submit(_SESSION.get, responses_url, headers=headers, stream=True)
+        export_response = export_future.result()
+    else:
+        # Only the export is needed, so skip the thread start-up cost
+        export_response = _SESSION.get(responses_url, headers=headers, stream=True)
+
+    # Stream the CSV straight into pandas instead of decoding it to a str first
+    with export_response as resp:
+        if study_future is not None:
+            study_response = study_future.result()
+            study_response.raise_for_status()
+            study_info = study_response.json()
+            _store_study_info(study_id, study_info, study_response.headers)
+
+        resp.raise_for_status()
+        resp.raw.decode_content = True  # undo gzip/deflate while reading
+        # Keep the stream open at EOF: _read_export may buffer a small export
+        # in full while peeking at its header, then parse from that buffer.
+        # The enclosing with block still closes the response.
+        resp.raw.auto_close = False
+        return _report_study_results(study_info, resp.raw, timezone_str, usecols)
+
+
+def _parse_utc(iso: str) -> datetime:
+    """Parse an ISO 8601 timestamp from the API into an aware UTC datetime."""
+    if sys.version_info < (3, 11) and iso.endswith("Z"):
+        # fromisoformat only understands a trailing "Z" from Python 3.11
+        iso = iso[:-1] + "+00:00"
+
+    parsed = datetime.fromisoformat(iso)
+    if parsed.tzinfo is timezone.utc:
+        return parsed
+    return parsed.astimezone(timezone.utc)
+
+
+def _report_study_results(study_info: dict, export, timezone_str: str, usecols: list = None) -> pd.DataFrame:
+    """
+    Print a study summary and parse its CSV export.
+
+    Args:
+        study_info: Study details as returned by the Prolific API
+        export: File-like object containing the CSV export
+        timezone_str: Timezone string for displaying times
+        usecols: Optional question columns to keep, see show_study_results
+
+    Returns:
+        pd.DataFrame: DataFrame containing study responses
+    """
+    display_tz = ZoneInfo(timezone_str)
 
     status = study_info.get("status")
     name = study_info.get("name")
@@ -196,7 +472,7 @@ def show_study_results(study_id: str, headers: dict, timezone_str: str = "Americ
 
     # Parse published_at as UTC, then convert to specified timezone for display
     published_iso = study_info.get("published_at")  # e.g. "2025-09-29T13:08:00Z"
-    created_at_utc = datetime.fromisoformat(published_iso.replace("Z", "+00:00")).astimezone(timezone.utc)
+    created_at_utc = _parse_utc(published_iso)
     created_at_display = created_at_utc.astimezone(display_tz)
 
     # --- Print basic study info ---
@@ -204,13 +480,9 @@ def show_study_results(study_id: str, headers: dict, timezone_str: str = "Americ
     print(f"📊 Status: {status}")
     print(f"👥 Total Places: {total_places}")
     print(f"📩 Total Submissions: {total_places_taken}")
-    print(f"⏳ Created at: {created_at_display.strftime('%d %b %Y, %I:%M %p %Z')}")
+    print(f"⏳ Created at: {created_at_display.strftime(_DISPLAY_TIME_FORMAT)}")
 
-    # --- Get response exports ---
-    responses_url = f"https://api.prolific.com/api/v1/studies/{study_id}/export/"
-    resp = requests.get(responses_url, headers=headers)
-    resp.raise_for_status()
-    df = pd.read_csv(StringIO(resp.text))
+    df = _read_export(export, usecols)
 
     if "Completed at" not in df.columns:
         print("⚠️ 'Completed at' column not found in export.")
@@ -225,7 +497,7 @@ def show_study_results(study_id: str, headers: dict, timezone_str: str = "Americ
         return df
 
     latest_completion_display = latest_completion_utc.tz_convert(display_tz)
-    print(f"🕒 Last Response At: {latest_completion_display.strftime('%d %b %Y, %I:%M %p %Z')}")
+    print(f"🕒 Last Response At: {latest_completion_display.strftime(_DISPLAY_TIME_FORMAT)}")
 
     # --- Compute duration (use UTC to avoid DST pitfalls), display in minutes ---
     duration_minutes = (latest_completion_utc - created_at_utc).total_seconds() / 60
@@ -234,6 +506,362 @@ def show_study_results(study_id: str, headers: dict, timezone_str: str = "Americ
     return df
 
 
+# Columns kept alongside the requested question columns when narrowing an export
+_DEFAULT_EXPORT_COLS = ("Submission id", "Completed at", "Age", "Sex")
+
+# How much of an export to look at when reading its header row
+_HEADER_PEEK_BYTES = 1 << 16
+
+
+def _read_export(export, usecols: list = None) -> pd.DataFrame:
+    """
+    Parse a CSV export, optionally keeping only the columns the caller needs.
+
+    Args:
+        export: Readable binary file-like object containing the CSV export.
+            It must not close itself at EOF (e.g. urllib3 auto_close), since
+            peeking at the header can read a small export to the end.
+        usecols: Optional question columns to keep, see show_study_results
+
+    Returns:
+        pd.DataFrame: The parsed export
+    """
+    if usecols is None:
+        return pd.read_csv(export, **_READ_CSV_OPTIONS)
+
+    if isinstance(usecols, str):
+        usecols = [usecols]
+
+    wanted = set(_DEFAULT_EXPORT_COLS).union(usecols)
+
+    def keep(col):
+        return col in wanted or col.startswith("Custom ")
+
+    # Peek at the header row without consuming it, so usecols can be the
+    # exact list of wanted names present in this export. Both engines then
+    # skip unused columns while parsing: the pyarrow engine rejects a
+    # callable usecols, and naming a missing column is an error on either.
+    export = BufferedReader(export, buffer_size=_HEADER_PEEK_BYTES)
+    head = export.peek(_HEADER_PEEK_BYTES)
+    names = None
+    if b"\n" in head:
+        names = next(csv.reader(StringIO(head.decode("utf-8-sig", errors="ignore"))), None)
+
+    if not names or len(set(names)) != len(names):
+        # Header not in the first chunk, or duplicate names that pandas will
+        # rename: parse everything and select afterwards
+        df = pd.read_csv(export, **_READ_CSV_OPTIONS)
+        return df[[col for col in df.columns if keep(col)]]
+
+    return pd.read_csv(export, usecols=[col for col in names if keep(col)], **_READ_CSV_OPTIONS)
+
+
+# --- Async API helpers ---
+# Coroutine counterparts of the helpers above, built on aiohttp so that many
+# studies can be created or polled concurrently. Pass a shared
+# ``aiohttp.ClientSession`` to reuse connections across calls. In a notebook,
+# ``await`` them directly; elsewhere, wrap them in ``asyncio.run``.
+
+
+@asynccontextmanager
+async def _client_session(session=None):
+    """Yield the given aiohttp session, or a temporary one if None."""
+    if session is not None:
+        yield session
+        return
+
+    import aiohttp
+
+    async with aiohttp.ClientSession() as own_session:
+        yield own_session
+
+
+async def get_researcher_id_async(headers: dict, session=None) -> str:
+    """
+    Fetch the Prolific researcher ID.
+
+    Args:
+        headers: Dictionary containing API authorization headers
+        session: Optional aiohttp.ClientSession to reuse
+
+    Returns:
+        str: The researcher ID
+    """
+    token = _auth_token(headers)
+    if token is not None and token in _RESEARCHER_IDS:
+        return _RESEARCHER_IDS[token]
+
+    async with _client_session(session) as client:
+        async with client.get("https://api.prolific.com/api/v1/users/me/", headers=headers) as res:
+            res.raise_for_status()
+            researcher_id = (await res.json())["id"]
+
+    if token is not None:
+        _RESEARCHER_IDS[token] = researcher_id
+    return researcher_id
+
+
+async def create_survey_async(headers: dict, researcher_id: str, survey_config: dict, session=None) -> str:
+    """
+    Create a Prolific survey with the specified configuration.
+
+    Args:
+        headers: Dictionary containing API authorization headers
+        researcher_id: The Prolific researcher ID
+        survey_config: Survey configuration, as for create_survey
+        session: Optional aiohttp.ClientSession to reuse
+
+    Returns:
+        str: The survey ID
+    """
+    survey_data = _build_survey_payload(researcher_id, survey_config)
+
+    async with _client_session(session) as client:
+        async with client.post(
+            "https://api.prolific.com/api/v1/surveys/",
+            headers={**headers, "Content-Type": "application/json"},
+            data=_dumps(survey_data)
+        ) as response:
+            response.raise_for_status()
+            return (await response.json())["_id"]
+
+
+async def create_study_async(
+    headers: dict,
+    survey_id: str,
+    study_config: dict,
+    project_id: str,
+    session=None
+) -> str:
+    """
+    Create a draft Prolific study.
+
+    Args:
+        headers: Dictionary containing API authorization headers
+        survey_id: The survey ID to link to this study
+        study_config: Study configuration, as for create_study
+        project_id: The Prolific project ID
+        session: Optional aiohttp.ClientSession to reuse
+
+    Returns:
+        str: The study ID
+    """
+    study_data = _build_study_payload(survey_id, study_config, project_id)
+
+    async with _client_session(session) as client:
+        async with client.post(
+            "https://api.prolific.com/api/v1/studies/",
+            headers={**headers, "Content-Type": "application/json"},
+            data=_dumps(study_data)
+        ) as study_response:
+            study_response.raise_for_status()
+            return (await study_response.json()).get("id")
+
+
+class BatchCreateError(Exception):
+    """
+    Raised when some studies in a batch could not be created.
+
+    Attributes:
+        study_ids: Study IDs in input order, with None where creation failed
+        errors: List of (index, exception) pairs for the failed studies
+    """
+
+    def __init__(self, study_ids: list, errors: list):
+        self.study_ids = study_ids
+        self.errors = errors
+        created = sum(study_id is not None for study_id in study_ids)
+        super().__init__(
+            f"{len(errors)} of {len(study_ids)} studies failed to create "
+            f"({created} created, see study_ids)"
+        )
+
+
+async def create_studies_batch(
+    headers: dict,
+    survey_ids: list,
+    study_configs: list,
+    project_id: str
+) -> list:
+    """
+    Create several draft Prolific studies over one multiplexed HTTP/2 connection.
+
+    Requires httpx with HTTP/2 support (pip install "httpx[http2]"). Unlike the
+    synchronous helpers, requests are not retried when rate limited.
+
+    Args:
+        headers: Dictionary containing API authorization headers
+        survey_ids: Survey IDs to link, one per study
+        study_configs: Study configurations, as for create_study, one per survey ID
+        project_id: The Prolific project ID
+
+    Returns:
+        list: Study IDs, in the same order as study_configs
+
+    Raises:
+        BatchCreateError: If any study failed; its study_ids still lists the
+            studies that were created, so they can be published or cleaned up
+    """
+    import httpx
+
+    if len(survey_ids) != len(study_configs):
+        raise ValueError("survey_ids and study_configs must have the same length")
+
+    payloads = [
+        _build_study_payload(survey_id, study_config, project_id)
+        for survey_id, study_config in zip(survey_ids, study_configs)
+    ]
+
+    async with httpx.AsyncClient(
+        http2=True,
+        base_url="https://api.prolific.com/api/v1",
+        headers={**headers, "Content-Type": "application/json"},
+    ) as client:
+        # Let every POST finish so one failure does not hide the drafts
+        # the others created
+        results = await asyncio.gather(*[
+            client.post("/studies/", content=_dumps(payload)) for payload in payloads
+        ], return_exceptions=True)
+
+    study_ids = []
+    errors = []
+    for index, result in enumerate(results):
+        if isinstance(result, Exception):
+            study_ids.append(None)
+            errors.append((index, result))
+            continue
+        if isinstance(result, BaseException):
+            raise result  # e.g. cancellation
+
+        try:
+            result.raise_for_status()
+            study_ids.append(result.json().get("id"))
+        except Exception as exc:
+            study_ids.append(None)
+            errors.append((index, exc))
+
+    if errors:
+        raise BatchCreateError(study_ids, errors)
+
+    return study_ids
+
+
+async def publish_study_async(headers: dict, study_id: str, session=None) -> int:
+    """
+    Publish a Prolific study.
+
+    Args:
+        headers: Dictionary containing API authorization headers
+        study_id: The study ID to publish
+        session: Optional aiohttp.ClientSession to reuse
+
+    Returns:
+        int: HTTP status code
+    """
+    async with _client_session(session) as client:
+        async with client.post(
+            f"https://api.prolific.com/api/v1/studies/{study_id}/transition/",
+            headers={**headers, "Content-Type": "application/json"},
+            data=_dumps({"action": "PUBLISH"})
+        ) as publish_response:
+            publish_response.raise_for_status()
+            return publish_response.status
+
+
+async def show_study_results_async(
+    study_id: str,
+    headers: dict,
+    timezone_str: str = "America/Los_Angeles",
+    usecols: list = None,
+    session=None
+) -> pd.DataFrame:
+    """
+    Fetch and display Prolific study info, latest response, and completion duration.
+
+    The study details and the CSV export are requested concurrently, unless
+    the study details are still cached from a recent call.
+
+    Args:
+        study_id: The study ID
+        headers: Dictionary containing API authorization headers
+        timezone_str: Timezone string for displaying times (default: "America/Los_Angeles")
+        usecols: Optional question column name, or list of names, to keep.
+            When given, the export is narrowed to these plus Submission id,
+            Completed at, Age, Sex and any "Custom ..." columns; by default
+            every column is kept
+        session: Optional aiohttp.ClientSession to reuse
+
+    Returns:
+        pd.DataFrame: DataFrame containing study responses
+    """
+    async def fetch(client, url):
+        async with client.get(url, headers=headers) as res:
+            res.raise_for_status()
+            return await res.read(), res.headers
+
+    study_url = f"https://api.prolific.com/api/v1/studies/{study_id}/"
+    responses_url = f"https://api.prolific.com/api/v1/studies/{study_id}/export/"
+    study_info = _cached_study_info(study_id)
+
+    async with _client_session(session) as client:
+        if study_info is None:
+            (study_body, study_headers), (export_body, _) = await asyncio.gather(
+                fetch(client, study_url),
+                fetch(client, responses_url),
+            )
+            study_info = json.loads(study_body)
+            _store_study_info(study_id, study_info, study_headers)
+        else:
+            export_body, _ = await fetch(client, responses_url)
+
+    return _report_study_results(study_info, BytesIO(export_body), timezone_str, usecols)
+
+
+async def gather_study_results(
+    study_ids: list,
+    headers: dict,
+    timezone_str: str = "America/Los_Angeles",
+    usecols: list = None,
+    session=None
+) -> list:
+    """
+    Fetch results for several studies concurrently.
+
+    Args:
+        study_ids: List of study IDs
+        headers: Dictionary containing API authorization headers
+        timezone_str: Timezone string for displaying times (default: "America/Los_Angeles")
+        usecols: Optional question columns to keep, see show_study_results
+        session: Optional aiohttp.ClientSession to reuse
+
+    Returns:
+        list: DataFrames of study responses, in the same order as study_ids
+    """
+    async with _client_session(session) as client:
+        return await asyncio.gather(*[
+            show_study_results_async(study_id, headers, timezone_str, usecols, session=client)
+            for study_id in study_ids
+        ])
+
+
+# Standard Prolific export columns, which are never the survey question
+_EXCLUDED_COLS = frozenset({
+    'Submission id', 'Participant id', 'Status', 'Started at', 'Completed at', 'Time taken',
+    'Age', 'Sex', 'Reviewed at', 'Archived at', 'Completion code', 'Country of birth',
+    'Country of residence', 'Nationality', 'Language', 'Student status', 'Employment status',
+    'Long-term health condition/disability', 'Fluent languages', 'Sexual orientation',
+    'Highest education level completed', 'Degree subject', 'Work role',
+    'Submission approval rate',
+})
+
+
+# Resolved question columns, keyed on (id(df.columns), question_text). Each
+# entry keeps a reference to its columns Index, so the id cannot be reused
+# while cached, and any change to a dataframe's columns yields a new Index.
+_COL_CACHE = {}
+_COL_CACHE_MAX = 128
+
+
 def find_question_column(df: pd.DataFrame, question_text: str) -> str:
     """
     Find the question column in the dataframe, trying exact match first,
@@ -250,29 +878,84 @@ def find_question_column(df: pd.DataFrame, question_text: str) -> str:
     if question_text in df.columns:
         return question_text
 
+    # Reuse the result of an earlier scan over the same columns
+    key = (id(df.columns), question_text)
+    hit = _COL_CACHE.get(key)
+    if hit is not None and hit[0] is df.columns:
+        return hit[1]
+
     # Otherwise, return the last column (typically the survey question)
     # But first check if there are any non-standard columns after the standard Prolific ones
-    standard_prolific_cols = ['Submission id', 'Participant id', 'Status', 'Started at',
-                               'Completed at', 'Time taken', 'Age', 'Sex']
-
-    # Find columns that are not standard Prolific columns - these are likely survey questions
-    survey_columns = [col for col in df.columns if col not in standard_prolific_cols
-                      and not col.startswith('Custom ')
-                      and col not in ['Reviewed at', 'Archived at', 'Completion code', 'Country of birth',
-                                      'Country of residence', 'Nationality', 'Language', 'Student status',
-                                      'Employment status', 'Long-term health condition/disability',
-                                      'Fluent languages', 'Sexual orientation',
-                                      'Highest education level completed', 'Degree subject',
-                                      'Work role', 'Submission approval rate']]
+    survey_columns = [col for col in df.columns
+                      if col not in _EXCLUDED_COLS and not col.startswith('Custom ')]
 
     if survey_columns:
-        return survey_columns[0]  # Return first survey question column
+        column = survey_columns[0]  # Return first survey question column
+    else:
+        # If all else fails, return the last column
+        column = df.columns[-1]
+
+    if len(_COL_CACHE) >= _COL_CACHE_MAX:
+        _COL_CACHE.clear()
+    _COL_CACHE[key] = (df.columns, column)
+
+    return column
+
+
+_plt = None
+
+
+def _lazy_plt():
+    """Import matplotlib.pyplot on first use, so non-plotting callers never pay for it."""
+    global _plt
+    if _plt is None:
+        import matplotlib.pyplot as plt
+        _plt = plt
+    return _plt
+
+
+def aggregate_responses(df: pd.DataFrame, question_column: str, by=None):
+    """
+    Count survey responses, optionally broken down by another column.
 
-    # If all else fails, return the last column
-    return df.columns[-1]
+    The plotting helpers accept the result as ``precomputed``, which skips
+    the column lookup and the scan over the dataframe. Compute it once when
+    a table is reused, e.g. for a plot and a printed summary.
 
+    Args:
+        df: DataFrame containing survey responses
+        question_column: Name of the column containing responses (will auto-detect if not found)
+        by: Optional column name or Series to break responses down by,
+            e.g. "Sex" or ages_to_generations(df["Age"])
+
+    Returns:
+        pd.Series of counts per response in ascending order if by is None,
+        otherwise a pd.DataFrame crosstab with one row per group
+    """
+    # Find the actual question column
+    actual_column = find_question_column(df, question_column)
 
-def plot_survey_responses(df: pd.DataFrame, question_column: str, wrap_width: int = 32, figsize: tuple = None):
+    if by is None:
+        # value_counts already sorts descending; reversing is cheaper than re-sorting
+        return (
+            df[actual_column]
+            .dropna()
+            .astype("string")
+            .value_counts()
+            .iloc[::-1]
+        )
+
+    groups = df[by] if isinstance(by, str) else by
+    return pd.crosstab(groups, df[actual_column])
+
+
+def plot_survey_responses(
+    df: pd.DataFrame,
+    question_column: str,
+    wrap_width: int = 32,
+    figsize: tuple = None,
+    precomputed: pd.Series = None
+):
     """
     Create a horizontal bar chart of survey responses.
 
@@ -281,25 +964,19 @@ def plot_survey_responses(df: pd.DataFrame, question_column: str, wrap_width: in
         question_column: Name of the column containing responses (will auto-detect if not found)
         wrap_width: Width for wrapping long labels (default: 32)
         figsize: Figure size as (width, height). If None, auto-calculated based on response count
+        precomputed: Optional result of aggregate_responses(df, question_column)
 
     Returns:
         matplotlib figure and axes objects
     """
-    import matplotlib.pyplot as plt
-    from textwrap import fill
+    plt = _lazy_plt()
 
-    # Find the actual question column
-    actual_column = find_question_column(df, question_column)
-
-    response_counts = (
-        df[actual_column]
-        .dropna()
-        .astype(str)
-        .value_counts()
-        .sort_values(ascending=True)
-    )
+    if precomputed is None:
+        response_counts = aggregate_responses(df, question_column)
+    else:
+        response_counts = precomputed
 
-    labels_wrapped = [fill(lbl, width=wrap_width) for lbl in response_counts.index]
+    labels_wrapped = pd.Series(response_counts.index, dtype="string").str.wrap(wrap_width).tolist()
 
     # Auto-calculate height if not specified
     if figsize is None:
@@ -321,6 +998,65 @@ def plot_survey_responses(df: pd.DataFrame, question_column: str, wrap_width: in
     return fig, ax
 
 
+def _plot_grouped_bars(ax, crosstab: pd.DataFrame, width: float, rot: int) -> None:
+    """
+    Draw a crosstab as grouped bars, one group per row and one bar per column.
+
+    Calls ax.bar directly on the count matrix, which builds far fewer
+    artists than going through DataFrame.plot.
+
+    Args:
+        ax: Matplotlib axes to draw on
+        crosstab: Counts with groups as rows and responses as columns
+        width: Total width of each group of bars
+        rot: Rotation of the group labels in degrees
+    """
+    data = crosstab.to_numpy()
+    x = np.arange(len(crosstab.index))
+    n_bars = max(data.shape[1], 1)
+    bar_width = width / n_bars
+
+    # Center each group of bars on its tick
+    for i, column in enumerate(crosstab.columns):
+        offset = (i - (n_bars - 1) / 2) * bar_width
+        ax.bar(x + offset, data[:, i], width=bar_width, label=str(column))
+
+    ax.set_xticks(x)
+    ax.set_xticklabels([str(label) for label in crosstab.index], rotation=rot)
+
+
+# Generation boundaries as left-closed age bins, in typical age order
+_GEN_BINS = np.array([-np.inf, 18, 28, 44, 60, 79, np.inf])
+_GEN_LABELS = [
+    "Gen Alpha (under 18)",
+    "Gen Z (18-27)",
+    "Millennial (28-43)",
+    "Gen X (44-59)",
+    "Baby Boomer (60-78)",
+    "Silent Generation (79+)",
+]
+
+
+def ages_to_generations(ages: pd.Series) -> pd.Series:
+    """
+    Convert a column of ages to generation labels in one vectorized pass.
+
+    Args:
+        ages: Series of ages in years (numbers or numeric strings)
+
+    Returns:
+        pd.Series: Generation labels named "Generation", with "Unknown" for invalid ages
+    """
+    numeric = pd.to_numeric(ages, errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+    generations = pd.cut(numeric, bins=_GEN_BINS, labels=_GEN_LABELS, right=False)
+
+    return (
+        pd.Series(generations, index=ages.index, name="Generation")
+        .astype(object)
+        .fillna("Unknown")
+    )
+
+
 def age_to_generation(age) -> str:
     """
     Convert age to generation label.
@@ -331,27 +1067,16 @@ def age_to_generation(age) -> str:
     Returns:
         str: Generation label with age range, or "Unknown" if age is invalid
     """
-    try:
-        # Convert to int if it's a string or float
-        age_int = int(float(age))
-    except (ValueError, TypeError):
-        return "Unknown"
-
-    if age_int < 18:
-        return "Gen Alpha (under 18)"
-    elif age_int <= 27:
-        return "Gen Z (18-27)"
-    elif age_int <= 43:
-        return "Millennial (28-43)"
-    elif age_int <= 59:
-        return "Gen X (44-59)"
-    elif age_int <= 78:
-        return "Baby Boomer (60-78)"
-    else:
-        return "Silent Generation (79+)"
+    return ages_to_generations(pd.Series([age], dtype=object)).iloc[0]
 
 
-def plot_responses_by_generation(df: pd.DataFrame, question_column: str, age_column: str = "Age", figsize: tuple = (10, 6)):
+def plot_responses_by_generation(
+    df: pd.DataFrame,
+    question_column: str,
+    age_column: str = "Age",
+    figsize: tuple = (10, 6),
+    precomputed: pd.DataFrame = None
+):
     """
     Create a grouped bar chart of survey responses by generation.
 
@@ -360,41 +1085,28 @@ def plot_responses_by_generation(df: pd.DataFrame, question_column: str, age_col
         question_column: Name of the column containing responses (will auto-detect if not found)
         age_column: Name of the column containing age data (default: "Age")
         figsize: Figure size as (width, height)
+        precomputed: Optional result of
+            aggregate_responses(df, question_column, by=ages_to_generations(df[age_column]))
 
     Returns:
         matplotlib figure and axes objects
     """
-    import matplotlib.pyplot as plt
-
-    # Find the actual question column
-    actual_column = find_question_column(df, question_column)
-
-    # Create a copy to avoid modifying original
-    df_copy = df.copy()
-
-    # Convert age to generation
-    df_copy['Generation'] = df_copy[age_column].apply(age_to_generation)
+    plt = _lazy_plt()
 
-    # Create crosstab
-    crosstab = pd.crosstab(df_copy['Generation'], df_copy[actual_column])
-
-    # Sort generations by typical age order
-    generation_order = [
-        "Gen Alpha (under 18)",
-        "Gen Z (18-27)",
-        "Millennial (28-43)",
-        "Gen X (44-59)",
-        "Baby Boomer (60-78)",
-        "Silent Generation (79+)"
-    ]
+    if precomputed is None:
+        # Crosstab against a standalone Generation series; no need to copy df
+        generations = ages_to_generations(df[age_column])
+        crosstab = aggregate_responses(df, question_column, by=generations)
+    else:
+        crosstab = precomputed
 
-    # Filter to only generations present in data
-    generation_order = [gen for gen in generation_order if gen in crosstab.index]
+    # Sort generations by typical age order, keeping only those present in data
+    generation_order = [gen for gen in _GEN_LABELS if gen in crosstab.index]
     crosstab = crosstab.reindex(generation_order)
 
     # Create plot
     fig, ax = plt.subplots(figsize=figsize)
-    crosstab.plot(kind='bar', ax=ax, rot=45, width=0.8)
+    _plot_grouped_bars(ax, crosstab, width=0.8, rot=45)
 
     ax.set_title(f"{question_column}\nby Generation", fontsize=14, pad=20)
     ax.set_xlabel("Generation", fontsize=12)
@@ -407,7 +1119,13 @@ def plot_responses_by_generation(df: pd.DataFrame, question_column: str, age_col
     return fig, ax
 
 
-def plot_responses_by_gender(df: pd.DataFrame, question_column: str, gender_column: str = "Sex", figsize: tuple = (9, 5)):
+def plot_responses_by_gender(
+    df: pd.DataFrame,
+    question_column: str,
+    gender_column: str = "Sex",
+    figsize: tuple = (9, 5),
+    precomputed: pd.DataFrame = None
+):
     """
     Create a grouped bar chart of survey responses by gender.
 
@@ -416,21 +1134,22 @@ def plot_responses_by_gender(df: pd.DataFrame, question_column: str, gender_colu
         question_column: Name of the column containing responses (will auto-detect if not found)
         gender_column: Name of the column containing gender data (default: "Sex")
         figsize: Figure size as (width, height)
+        precomputed: Optional result of aggregate_responses(df, question_column, by=gender_column)
 
     Returns:
         matplotlib figure and axes objects
     """
-    import matplotlib.pyplot as plt
-
-    # Find the actual question column
-    actual_column = find_question_column(df, question_column)
+    plt = _lazy_plt()
 
     # Create crosstab
-    crosstab = pd.crosstab(df[gender_column], df[actual_column])
+    if precomputed is None:
+        crosstab = aggregate_responses(df, question_column, by=gender_column)
+    else:
+        crosstab = precomputed
 
     # Create plot
     fig, ax = plt.subplots(figsize=figsize)
-    crosstab.plot(kind='bar', ax=ax, rot=0, width=0.7)
+    _plot_grouped_bars(ax, crosstab, width=0.7, rot=0)
 
     ax.set_title(f"{question_column}\nby Gender", fontsize=14, pad=20)
     ax.set_xlabel("Gender", fontsize=12)